@@ -1,4 +1,4 @@
-from collections import defaultdict
+from typing import Any, Dict
 
 import sentry_sdk
 from rest_framework.request import Request
@@ -7,7 +7,7 @@ from rest_framework.response import Response
 from sentry import tagstore
 from sentry.api.base import region_silo_endpoint
 from sentry.api.bases import NoProjects, OrganizationEventsV2EndpointBase
-from sentry.search.utils import DEVICE_CLASS
+from sentry.search.utils import map_device_class_level
 from sentry.snuba import discover
 
 
@@ -32,10 +32,12 @@ class OrganizationEventsFacetsEndpoint(OrganizationEventsV2EndpointBase):
 
         with sentry_sdk.start_span(op="discover.endpoint", description="populate_results") as span:
             span.set_data("facet_count", len(facets or []))
-            resp = defaultdict(lambda: {"key": "", "topValues": []})
+            resp: Dict[str, Dict[str, Any]] = {}
             for row in facets:
-                values = resp[row.key]
-                values["key"] = tagstore.get_standardized_key(row.key)
+                values = resp.get(row.key)
+                if values is None:
+                    values = {"key": tagstore.get_standardized_key(row.key), "topValues": []}
+                    resp[row.key] = values
                 values["topValues"].append(
                     {
                         "name": tagstore.get_tag_value_label(row.key, row.value),
@@ -46,8 +48,9 @@ class OrganizationEventsFacetsEndpoint(OrganizationEventsV2EndpointBase):
 
             if "project" in resp:
                 # Replace project ids with slugs as that is what we generally expose to users
-                # and filter out projects that the user doesn't have access too.
-                projects = {p.id: p.slug for p in self.get_projects(request, organization)}
+                # and filter out projects that the user doesn't have access too. The accessible
+                # projects were already resolved when building the snuba params, so reuse them.
+                projects = {p.id: p.slug for p in params["project_objects"]}
                 filtered_values = []
                 for v in resp["project"]["topValues"]:
                     if v["value"] in projects:
@@ -61,12 +64,10 @@ class OrganizationEventsFacetsEndpoint(OrganizationEventsV2EndpointBase):
                 # Map device.class tag values to low, medium, or high
                 filtered_values = []
                 for v in resp["device.class"]["topValues"]:
-                    for key, value in DEVICE_CLASS.items():
-                        if v["value"] in value:
-                            name = key
-                            v.update({"name": name})
-                            filtered_values.append(v)
-                            continue
+                    name = map_device_class_level(v["value"])
+                    if name is not None:
+                        v.update({"name": name})
+                        filtered_values.append(v)
 
                 resp["device.class"]["topValues"] = filtered_values
 
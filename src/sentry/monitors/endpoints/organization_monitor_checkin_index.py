@@ -8,7 +8,7 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 
 from sentry.api.base import region_silo_endpoint
-from sentry.api.paginator import OffsetPaginator
+from sentry.api.paginator import DateTimePaginator
 from sentry.api.serializers import serialize
 from sentry.api.utils import get_date_range_from_params
 from sentry.apidocs.constants import RESPONSE_FORBIDDEN, RESPONSE_NOTFOUND, RESPONSE_UNAUTHORIZED
@@ -63,5 +63,5 @@ class OrganizationMonitorCheckInIndexEndpoint(MonitorEndpoint):
             queryset=queryset,
             order_by="-date_added",
             on_results=lambda x: serialize(x, request.user),
-            paginator_cls=OffsetPaginator,
+            paginator_cls=DateTimePaginator,
         )
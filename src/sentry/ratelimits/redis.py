@@ -106,8 +106,12 @@ class RedisRateLimiter(RateLimiter):
         # Reset Time = next time bucket's start time
         reset_time = _bucket_start_time(_time_bucket(request_time, window) + 1, window)
         try:
-            result = self.client.incr(redis_key)
-            self.client.expire(redis_key, expiration)
+            # Send both commands in a single round trip so the counter can never
+            # be left behind without an expiration.
+            with self.client.pipeline() as pipe:
+                pipe.incr(redis_key)
+                pipe.expire(redis_key, expiration)
+                result = pipe.execute()[0]
         except RedisError:
             # We don't want rate limited endpoints to fail when ratelimits
             # can't be updated. We do want to know when that happens.
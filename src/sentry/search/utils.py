@@ -764,9 +764,11 @@ DEVICE_CLASS = {
     "high": {"3"},
 }
 
+# Reverse lookup of DEVICE_CLASS, mapping each stored tag value to its device class
+DEVICE_CLASS_LEVELS = {
+    value: device_class for device_class, values in DEVICE_CLASS.items() for value in values
+}
+
 
 def map_device_class_level(device_class: str) -> Optional[str]:
-    for key, value in DEVICE_CLASS.items():
-        if device_class in value:
-            return key
-    return None
+    return DEVICE_CLASS_LEVELS.get(device_class)
@@ -179,7 +179,6 @@ def serialize_rpc_user(user: User) -> RpcUser:
     args["is_superuser"] = user.is_superuser
     args["is_sentry_app"] = user.is_sentry_app
     args["password_usable"] = user.has_usable_password()
-    args["emails"] = frozenset([email.email for email in user.get_verified_emails()])
 
     # And process the _base_query special data additions
     permissions: FrozenSet[str] = frozenset({})
@@ -205,7 +204,18 @@ def serialize_rpc_user(user: User) -> RpcUser:
             }
         )
     args["useremails"] = useremails
-    avatar = user.avatar.first()
+
+    # Reuse the emails and avatar fetched by _base_query when they are available, to
+    # avoid issuing extra queries for every user being serialized.
+    if hasattr(user, "useremails"):
+        args["emails"] = frozenset([e.email for e in useremails if e.is_verified])
+    else:
+        args["emails"] = frozenset([email.email for email in user.get_verified_emails()])
+
+    if user.is_field_cached("avatar"):
+        avatar = user.get_cached_field_value("avatar")
+    else:
+        avatar = user.avatar.first()
     if avatar is not None:
         avatar = RpcAvatar(
             id=avatar.id,
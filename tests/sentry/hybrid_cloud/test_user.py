@@ -0,0 +1,26 @@
+from sentry.models import UserAvatar
+from sentry.services.hybrid_cloud.user import user_service
+from sentry.testutils import TestCase
+from sentry.testutils.silo import control_silo_test
+
+
+@control_silo_test(stable=True)
+class DatabaseBackedUserServiceTest(TestCase):
+    def test_get_many_emails_and_avatar(self):
+        user = self.create_user(email="verified@example.com")
+        self.create_useremail(user, "unverified@example.com", is_verified=False)
+        avatar = UserAvatar.objects.create(user=user, avatar_type=2)
+        other_user = self.create_user()
+
+        rpc_users = {
+            u.id: u for u in user_service.get_many(filter={"user_ids": [user.id, other_user.id]})
+        }
+
+        assert rpc_users[user.id].emails == {"verified@example.com"}
+        assert {e.email for e in rpc_users[user.id].useremails} == {
+            "verified@example.com",
+            "unverified@example.com",
+        }
+        assert rpc_users[user.id].avatar.id == avatar.id
+        assert rpc_users[user.id].avatar.avatar_type == "gravatar"
+        assert rpc_users[other_user.id].avatar is None
@@ -41,6 +41,30 @@ class ListMonitorCheckInsTest(MonitorTestCase):
         assert resp.data[0]["id"] == str(checkin2.guid)
         assert resp.data[1]["id"] == str(checkin1.guid)
 
+    def test_pagination(self):
+        monitor = self._create_monitor()
+        checkins = [
+            MonitorCheckIn.objects.create(
+                monitor=monitor,
+                project_id=self.project.id,
+                date_added=monitor.date_added - timedelta(minutes=minutes),
+                status=CheckInStatus.OK,
+            )
+            for minutes in (3, 2, 1)
+        ]
+
+        resp = self.get_success_response(
+            self.organization.slug, monitor.slug, **{"statsPeriod": "1d", "per_page": 2}
+        )
+        assert [c["id"] for c in resp.data] == [str(checkins[2].guid), str(checkins[1].guid)]
+
+        resp = self.get_success_response(
+            self.organization.slug,
+            monitor.slug,
+            **{"statsPeriod": "1d", "per_page": 2, "cursor": self.get_cursor_headers(resp)[1]},
+        )
+        assert [c["id"] for c in resp.data] == [str(checkins[0].guid)]
+
     def test_statsperiod_constraints(self):
         monitor = self._create_monitor()
 
@@ -1,17 +1,21 @@
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test.utils import CaptureQueriesContext
+
 from sentry.models import NotificationSetting, OrganizationMember
 from sentry.notifications.notifications.organization_request import OrganizationRequestNotification
 from sentry.notifications.notifications.strategies.role_based_recipient_strategy import (
     RoleBasedRecipientStrategy,
 )
 from sentry.notifications.types import NotificationSettingOptionValues, NotificationSettingTypes
-from sentry.services.hybrid_cloud.user import user_service
 from sentry.testutils import TestCase
 from sentry.types.integrations import ExternalProviders
 
 
 class DummyRoleBasedRecipientStrategy(RoleBasedRecipientStrategy):
     def determine_member_recipients(self):
-        return OrganizationMember.objects.filter(organization=self.organization)
+        return OrganizationMember.objects.filter(organization=self.organization).only(
+            "id", "user", "organization"
+        )
 
 
 class DummyRequestNotification(OrganizationRequestNotification):
@@ -24,16 +28,18 @@ class GetParticipantsTest(TestCase):
     def setUp(self):
         self.user2 = self.create_user()
         self.create_member(user=self.user2, organization=self.organization)
+        self.expected_user_ids = {self.user.id, self.user2.id}
 
     def test_default_to_slack(self):
         notification = DummyRequestNotification(self.organization, self.user)
 
-        rpc_user = user_service.get_user(self.user.id)
-        rpc_user_2 = user_service.get_user(self.user2.id)
-
-        assert notification.get_participants() == {
-            ExternalProviders.EMAIL: {rpc_user, rpc_user_2},
-            ExternalProviders.SLACK: {rpc_user, rpc_user_2},
+        participant_ids = {
+            provider: {user.id for user in users}
+            for provider, users in notification.get_participants().items()
+        }
+        assert participant_ids == {
+            ExternalProviders.EMAIL: self.expected_user_ids,
+            ExternalProviders.SLACK: self.expected_user_ids,
         }
 
     def test_turn_off_settings(self):
@@ -53,10 +59,27 @@ class GetParticipantsTest(TestCase):
 
         notification = DummyRequestNotification(self.organization, self.user)
 
-        rpc_user = user_service.get_user(self.user.id)
-        rpc_user_2 = user_service.get_user(self.user2.id)
+        participant_ids = {
+            provider: {user.id for user in users}
+            for provider, users in notification.get_participants().items()
+        }
+        assert participant_ids == {
+            ExternalProviders.EMAIL: self.expected_user_ids,
+            ExternalProviders.SLACK: self.expected_user_ids,
+        }
+
+    def test_query_count_does_not_grow_with_members(self):
+        notification = DummyRequestNotification(self.organization, self.user)
+        with CaptureQueriesContext(connections[DEFAULT_DB_ALIAS]) as queries:
+            notification.get_participants()
+
+        user3 = self.create_user()
+        self.create_member(user=user3, organization=self.organization)
 
-        assert notification.get_participants() == {
-            ExternalProviders.EMAIL: {rpc_user, rpc_user_2},
-            ExternalProviders.SLACK: {rpc_user, rpc_user_2},
+        with self.assertNumQueries(len(queries.captured_queries)):
+            participants = notification.get_participants()
+        assert {user.id for user in participants[ExternalProviders.EMAIL]} == {
+            self.user.id,
+            self.user2.id,
+            user3.id,
         }
@@ -67,3 +67,9 @@ class RedisRateLimiterTest(TestCase):
             assert not limited
             assert value == 1
             assert reset_time == expected_reset_time + 5
+
+    def test_is_limited_sets_expiration(self):
+        with freeze_time("2000-01-01"):
+            self.backend.is_limited("foo", 1, window=10)
+            redis_key = self.backend._construct_redis_key("foo", window=10)
+            assert 0 < self.backend.client.ttl(redis_key) <= 10